@@ -94,19 +94,62 @@ const AiAgentChatbot: React.FC<ChatbotProps> = ({
         throw new Error(`HTTP error! status: ${response.status}`);
       }
 
-      const data = await response.json();
+      const contentType = response.headers.get("content-type") || "";
 
-      const assistantMessage: Message = {
-        id: (Date.now() + 1).toString(),
-        content:
-          data.response ||
-          data.message ||
-          "Sorry, I couldn't process your request.",
-        role: "assistant",
-        timestamp: new Date(),
-      };
+      if (response.body && !contentType.includes("application/json")) {
+        // Streaming endpoint: render chunks as they arrive instead of
+        // waiting for the full response to buffer.
+        const assistantId = (Date.now() + 1).toString();
+        setMessages((prev) => [
+          ...prev,
+          {
+            id: assistantId,
+            content: "",
+            role: "assistant",
+            timestamp: new Date(),
+          },
+        ]);
 
-      setMessages((prev) => [...prev, assistantMessage]);
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let streamed = "";
+
+        while (true) {
+          const { done, value } = await reader.read();
+          if (done) break;
+          streamed += decoder.decode(value, { stream: true });
+          const content = streamed;
+          setMessages((prev) =>
+            prev.map((msg) =>
+              msg.id === assistantId ? { ...msg, content } : msg
+            )
+          );
+        }
+
+        if (!streamed.trim()) {
+          setMessages((prev) =>
+            prev.map((msg) =>
+              msg.id === assistantId
+                ? { ...msg, content: "Sorry, I couldn't process your request." }
+                : msg
+            )
+          );
+        }
+      } else {
+        const data = await response.json();
+
+        const assistantMessage: Message = {
+          id: (Date.now() + 1).toString(),
+          content:
+            data.response ||
+            data.message ||
+            "Sorry, I couldn't process your request.",
+          role: "assistant",
+          timestamp: new Date(),
+        };
+
+        setMessages((prev) => [...prev, assistantMessage]);
+      }
     } catch (err) {
       setError("Failed to send message. Please try again.");
       console.error("Chat error:", err);